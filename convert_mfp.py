@@ -10,10 +10,10 @@ synced from MyFitnessPal. This script sums all meals per day.
 """
 
 import csv
+import itertools
 import sys
 from collections import defaultdict
 from pathlib import Path
-from datetime import datetime
 
 
 def convert(input_path: str, output_path: str = None):
@@ -26,21 +26,35 @@ def convert(input_path: str, output_path: str = None):
     with open(inp, "r", encoding="utf-8") as f:
         # Skip the first metadata line (e.g. "com.samsung.health.food_intake,6307003,6")
         first_line = f.readline()
-        if not first_line.startswith("com.samsung.health"):
-            f.seek(0)  # not a metadata line, rewind
+        if first_line.startswith("com.samsung.health"):
+            lines = f
+        else:
+            # Not a metadata line; put it back in front instead of seeking back
+            lines = itertools.chain([first_line], f)
+
+        reader = csv.reader(lines)
+        header = next(reader, [])
+        try:
+            i_date = header.index("start_time")
+            i_cal = header.index("calorie")
+        except ValueError:
+            print(f"❌ {inp.name}: expected 'start_time' and 'calorie' columns")
+            return
 
-        reader = csv.DictReader(f)
         for row in reader:
             try:
-                date_str = row.get("start_time", "").strip()
-                cal_str = row.get("calorie", "").strip()
+                date_str = row[i_date].strip()
+                cal_str = row[i_cal].strip()
                 if not date_str or not cal_str:
                     continue
-                # Parse date — format is "2021-10-30 04:00:00.000"
-                dt = datetime.strptime(date_str.split(" ")[0], "%Y-%m-%d")
+                # Date prefix — format is "2021-10-30 04:00:00.000".
+                # Already YYYY-MM-DD, so use it as the key (ISO dates sort as strings).
+                key = date_str[:10]
+                if len(key) != 10 or key[4] != "-" or key[7] != "-":
+                    continue
                 cal = float(cal_str)
-                daily[dt.strftime("%Y-%m-%d")] += cal
-            except (ValueError, KeyError):
+                daily[key] += cal
+            except (ValueError, IndexError):
                 continue
 
     # Sort by date and write
@@ -48,8 +62,7 @@ def convert(input_path: str, output_path: str = None):
     with open(output_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["Date", "Calories"])
-        for date, cals in sorted_days:
-            writer.writerow([date, round(cals)])
+        writer.writerows([(date, round(cals)) for date, cals in sorted_days])
 
     print(f"✅ Wrote {len(sorted_days)} days to {output_path}")
     print(f"   Date range: {sorted_days[0][0]} → {sorted_days[-1][0]}")
@@ -15,91 +15,222 @@ Notes:
   - Meditation tracked separately (Samsung misclassifies as exercise)
 """
 
+import argparse
+import numpy as np
 import pandas as pd
 import os
-import glob
+import re
+import functools
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# ─── Helpers ─────────────────────────────────────────────────────────
+
+def _parse_dates(values):
+    """
+    Parse dates on the fast ISO 8601 path, falling back to pandas' format
+    inference for anything else (hand-converted exports vary). Returns the
+    dates and how many non-empty values still couldn't be read.
+    """
+    dates = pd.to_datetime(values, format='ISO8601', errors='coerce')
+    retry = dates.isna() & values.notna()
+    if retry.any():
+        dates[retry] = pd.to_datetime(values[retry], errors='coerce')
+    return dates, int((dates.isna() & values.notna()).sum())
+
+
+def _daily_sums(dates, columns):
+    """
+    Sum each value column per distinct date with np.bincount.
+    `dates` must be free of NaT; returns a Date-sorted frame with one row per day.
+    """
+    codes, days = pd.factorize(dates, sort=True)
+    sums = {name: np.bincount(codes, weights=np.asarray(values, dtype=float), minlength=len(days))
+            for name, values in columns.items()}
+    return pd.DataFrame({'Date': days, **sums})
+
+
+def _cached(cache_dir, name, source, parse, *args, force=False):
+    """
+    Return parse(*args), reusing a pickled result while `source` is unchanged.
+    Entries are keyed on the source file's mtime and size; an unreadable entry
+    (truncated write, other pandas version) is ignored and re-parsed.
+    """
+    if source is None or not os.path.exists(source):
+        return parse(*args)
+    
+    st = os.stat(source)
+    path = os.path.join(cache_dir, f"{name}_{st.st_mtime_ns}_{st.st_size}.pkl")
+    if not force and os.path.exists(path):
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:  # unpickling can fail in many ways; the cache is disposable
+            print(f"  Ignoring unreadable cache {os.path.basename(path)} ({type(e).__name__})")
+    
+    result = parse(*args)
+    
+    # Write to a temp file and rename so an interrupted run never leaves a
+    # truncated entry under a valid key; drop stale entries only afterwards
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}_", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pd.to_pickle(result, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    
+    for e in os.scandir(cache_dir):
+        if e.name.startswith(f"{name}_") and e.name.endswith('.pkl') and e.path != path:
+            os.remove(e.path)
+    return result
+
 
 # ─── MFP Diary Parsing ───────────────────────────────────────────────
 
+DIARY_NUMERIC = ['calories', 'carbs_g', 'fat_g', 'protein_g', 'sugar_g',
+                 'fiber_g', 'sodium_mg', 'cholesterol_mg', 'duration_min']
+
+
 def parse_mfp_diary(csv_path):
     """Parse the user-converted mfp_diary.csv into daily nutrition totals."""
     if not os.path.exists(csv_path):
         print(f"MFP diary not found: {csv_path}")
         return pd.DataFrame()
     
-    df = pd.read_csv(csv_path, encoding='utf-8', on_bad_lines='warn')
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    # Only load the columns we aggregate; the repetitive text columns come in
+    # as categoricals rather than one Python string object per cell
+    text_dtypes = {'entry_type': 'category', 'food': 'category'}
+    read = dict(encoding='utf-8', on_bad_lines='warn',
+                usecols=['date', 'entry_type', 'food'] + DIARY_NUMERIC)
+    try:
+        # Let the C parser convert the nutrient columns while tokenizing
+        df = pd.read_csv(csv_path, dtype={**text_dtypes, **dict.fromkeys(DIARY_NUMERIC, 'float64')}, **read)
+    except ValueError:
+        # Some cell isn't a plain number; read as text and coerce below
+        df = pd.read_csv(csv_path, dtype=text_dtypes, **read)
+    df['date'], unreadable = _parse_dates(df['date'])
     df = df.dropna(subset=['date'])
     
-    # Food entries (exclude Generic summary rows)
-    food = df[(df['entry_type'] == 'food') & ~df['food'].str.startswith('Generic', na=False)].copy()
-    for col in ['calories','carbs_g','fat_g','protein_g','sugar_g','fiber_g','sodium_mg','cholesterol_mg']:
-        food[col] = pd.to_numeric(food[col], errors='coerce').fillna(0)
-    
-    daily_food = food.groupby('date').agg(
-        MFP_Calories=('calories', 'sum'),
-        Carbs_g=('carbs_g', 'sum'),
-        Fat_g=('fat_g', 'sum'),
-        Protein_g=('protein_g', 'sum'),
-        Sugar_g=('sugar_g', 'sum'),
-        Fiber_g=('fiber_g', 'sum'),
-        Sodium_mg=('sodium_mg', 'sum'),
-        Cholesterol_mg=('cholesterol_mg', 'sum'),
-        Food_Items=('food', 'count'),
-    ).reset_index()
-    
-    # Exercise entries (exclude Generic)
-    ex = df[(df['entry_type'] == 'exercise') & ~df['food'].str.startswith('Generic', na=False)].copy()
-    ex['calories'] = pd.to_numeric(ex['calories'], errors='coerce').fillna(0)
-    ex['duration_min'] = pd.to_numeric(ex['duration_min'], errors='coerce').fillna(0)
-    
-    if not ex.empty:
-        daily_ex = ex.groupby('date').agg(
-            MFP_Exercise_Calories=('calories', 'sum'),
-            MFP_Exercise_Minutes=('duration_min', 'sum'),
-        ).reset_index()
-    else:
-        daily_ex = pd.DataFrame(columns=['date', 'MFP_Exercise_Calories', 'MFP_Exercise_Minutes'])
-    
-    daily = pd.merge(daily_food, daily_ex, on='date', how='outer').fillna(0)
-    daily = daily.rename(columns={'date': 'Date'})
-    daily['Date'] = daily['Date'].dt.normalize()
-    return daily.sort_values('Date')
+    # Food and exercise entries (exclude Generic summary rows). Food names repeat
+    # heavily, so test each distinct name once and broadcast via category codes;
+    # the trailing False is picked up by code -1 (missing name).
+    foods = df['food']
+    generic = np.array([isinstance(c, str) and c.startswith('Generic')
+                        for c in foods.cat.categories] + [False], dtype=bool)
+    is_generic = generic[foods.cat.codes.to_numpy()]
+    df = df[df['entry_type'].isin(['food', 'exercise']) & ~is_generic]
+    values = df[DIARY_NUMERIC].apply(pd.to_numeric, errors='coerce').fillna(0)
+    values['items'] = df['food'].notna()
+    is_exercise = (df['entry_type'] == 'exercise').to_numpy()
+    codes, days = pd.factorize(df['date'].dt.normalize(), sort=True)
+    
+    # Sum both entry types in one pass per column: bin 2*day holds a day's food
+    # totals and bin 2*day+1 its exercise totals, so nothing has to be masked
+    bins = 2 * codes + is_exercise
+    totals = {col: np.bincount(bins, weights=values[col].to_numpy(dtype=float),
+                               minlength=2 * len(days)).reshape(-1, 2)
+              for col in values.columns}
+    food = {col: t[:, 0] for col, t in totals.items()}
+    ex = {col: t[:, 1] for col, t in totals.items()}
+    
+    daily = pd.DataFrame({
+        'Date': days,
+        'MFP_Calories': food['calories'],
+        'Carbs_g': food['carbs_g'],
+        'Fat_g': food['fat_g'],
+        'Protein_g': food['protein_g'],
+        'Sugar_g': food['sugar_g'],
+        'Fiber_g': food['fiber_g'],
+        'Sodium_mg': food['sodium_mg'],
+        'Cholesterol_mg': food['cholesterol_mg'],
+        'Food_Items': food['items'].astype(int),
+        'MFP_Exercise_Calories': ex['calories'],
+        'MFP_Exercise_Minutes': ex['duration_min'],
+    })
+    daily = daily.sort_values('Date')
+    # Kept on the frame (and so in the parse cache) for main() to report
+    daily.attrs['unreadable_dates'] = unreadable
+    return daily
 
 
 # ─── Samsung Health Parsing (using known column structure) ───────────
 
+# Samsung timestamps look like "2021-10-30 04:00:00.000"
+SAMSUNG_TIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+# Side tables that share the exercise file prefix but aren't workout sessions
+EXERCISE_FILE_BLACKLIST = re.compile(
+    r'weather|custom_exercise|hr_zone|max_heart_rate|recovery_heart_rate|routine|periodization')
+
+
+def _dir_mtime(directory):
+    """Directory mtime used to invalidate the file-pick caches (None if missing)."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _pick_weight_file(directory, mtime_key):
+    """First com.samsung.health.weight.*.csv in directory, or None."""
+    if mtime_key is None:
+        return None
+    for e in os.scandir(directory):
+        if e.name.startswith('com.samsung.health.weight.') and e.name.endswith('.csv'):
+            return e.path
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _pick_exercise_file(directory, mtime_key):
+    """Largest exercise session CSV in directory (side tables excluded), or None."""
+    if mtime_key is None:
+        return None
+    files = [e.path for e in os.scandir(directory)
+             if e.name.startswith('com.samsung.shealth.exercise.') and e.name.endswith('.csv')
+             and not EXERCISE_FILE_BLACKLIST.search(e.name)]
+    return max(files, key=os.path.getsize) if files else None
+
+
+def _samsung_columns(path):
+    """Header of a Samsung CSV (metadata line skipped), without reading any rows."""
+    header = pd.read_csv(path, skiprows=1, nrows=0, encoding='utf-8-sig', index_col=False)
+    return header.columns.tolist()
+
+
 def parse_samsung_weight(directory):
     """
     Parse Samsung weight CSV.
     Known structure: skiprows=1, columns include 'start_time' and 'weight'.
     Leading comma may cause column shift.
     """
-    files = glob.glob(os.path.join(directory, "com.samsung.health.weight.*.csv"))
-    if not files:
+    weight_file = _pick_weight_file(directory, _dir_mtime(directory))
+    if weight_file is None:
         print("  Weight file not found.")
         return pd.DataFrame(columns=['Date', 'Weight_kg'])
     
-    # Read with index_col=False to handle leading commas
-    df = pd.read_csv(files[0], skiprows=1, low_memory=False, encoding='utf-8-sig', index_col=False)
-    
-    # If first column is unnamed/empty (from leading comma), drop it
-    first_col = df.columns[0]
-    if 'Unnamed' in str(first_col) or first_col == '':
-        df = df.drop(columns=[first_col])
-    
-    if 'start_time' not in df.columns or 'weight' not in df.columns:
-        print(f"  Weight: expected columns not found. Got: {df.columns.tolist()[:8]}")
+    # Probe the header, then load only the columns we use.
+    # index_col=False handles the trailing comma on every row.
+    columns = _samsung_columns(weight_file)
+    if 'start_time' not in columns or 'weight' not in columns:
+        print(f"  Weight: expected columns not found. Got: {columns[:8]}")
         return pd.DataFrame(columns=['Date', 'Weight_kg'])
     
-    df['Date'] = pd.to_datetime(df['start_time'], errors='coerce').dt.normalize()
+    df = pd.read_csv(weight_file, skiprows=1, encoding='utf-8-sig', index_col=False,
+                     usecols=['start_time', 'weight'])
+    
+    df['Measured'] = pd.to_datetime(df['start_time'], format=SAMSUNG_TIME_FORMAT, errors='coerce')
+    df['Date'] = df['Measured'].dt.normalize()
     df['Weight_kg'] = pd.to_numeric(df['weight'], errors='coerce')
-    result = df[['Date', 'Weight_kg']].dropna()
+    result = df[['Measured', 'Date', 'Weight_kg']].dropna()
     
-    # Keep last measurement per day
-    result = result.groupby('Date').last().reset_index()
-    return result
+    # Keep the latest measurement per day (sorting by time also orders by Date)
+    result = result.sort_values('Measured', kind='stable').drop_duplicates('Date', keep='last')
+    return result[['Date', 'Weight_kg']].reset_index(drop=True)
 
 
 def parse_samsung_exercise(directory):
@@ -123,77 +254,70 @@ def parse_samsung_exercise(directory):
     MEDITATION_TYPES = {15002, 15003, 15005, 15006}
     AUTO_DETECTED = {0}  # Passive auto-detected, excluded from totals
     
-    files = [f for f in glob.glob(os.path.join(directory, "com.samsung.shealth.exercise.*.csv"))
-             if not any(x in f for x in ['weather','custom_exercise','hr_zone',
-                'max_heart_rate','recovery_heart_rate','routine','periodization'])]
-    
-    if not files:
+    main_file = _pick_exercise_file(directory, _dir_mtime(directory))
+    if main_file is None:
         print("  Exercise file not found.")
         empty_ex = pd.DataFrame(columns=['Date', 'Exercise_Calories', 'Exercise_Minutes'])
         empty_med = pd.DataFrame(columns=['Date', 'Meditation_Minutes'])
         return empty_ex, empty_med
     
-    main_file = max(files, key=os.path.getsize)
-    df = pd.read_csv(main_file, skiprows=1, low_memory=False, encoding='utf-8-sig', index_col=False)
-    
-    # Drop unnamed first column if present
-    first_col = df.columns[0]
-    if 'Unnamed' in str(first_col) or first_col == '':
-        df = df.drop(columns=[first_col])
-    
     # Map columns
     start_col = 'com.samsung.health.exercise.start_time'
     type_col = 'com.samsung.health.exercise.exercise_type'
     dur_col = 'com.samsung.health.exercise.duration'
     cal_col = 'com.samsung.health.exercise.calorie'
     
-    if start_col not in df.columns:
+    columns = _samsung_columns(main_file)
+    if start_col not in columns:
         print(f"  Exercise: {start_col} not found.")
         return pd.DataFrame(columns=['Date','Exercise_Calories','Exercise_Minutes']), \
                pd.DataFrame(columns=['Date','Meditation_Minutes'])
     
-    df['Date'] = pd.to_datetime(df[start_col], errors='coerce').dt.normalize()
-    df = df.dropna(subset=['Date'])
+    # The export has 50+ columns; only materialize the four we need
+    wanted = [c for c in (start_col, type_col, dur_col, cal_col) if c in columns]
+    df = pd.read_csv(main_file, skiprows=1, encoding='utf-8-sig', index_col=False, usecols=wanted)
+    
+    # Classify by type on a plain int array (-1 = missing/unknown type)
+    if type_col in df.columns:
+        types = pd.to_numeric(df[type_col], errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+    else:
+        types = np.full(len(df), -1, dtype=np.int64)
+    
+    is_auto = np.isin(types, list(AUTO_DETECTED))
+    
+    # Drop auto-detected rows up front so the per-row parsing below skips them
+    df = df[~is_auto]
+    is_meditation = np.isin(types[~is_auto], list(MEDITATION_TYPES))
+    
+    # Only the day matters, so parse just the date prefix of the timestamp
+    # (cast first: an all-empty column is read as float and has no .str)
+    dates = pd.to_datetime(df[start_col].astype('string').str.slice(0, 10), format='%Y-%m-%d', errors='coerce')
+    has_date = dates.notna().to_numpy()
     
     # Duration: ms → minutes
     if dur_col in df.columns:
-        df['Duration_min'] = pd.to_numeric(df[dur_col], errors='coerce').fillna(0) / 60000
+        minutes = pd.to_numeric(df[dur_col], errors='coerce').fillna(0) / 60000
     else:
-        df['Duration_min'] = 0
+        minutes = pd.Series(0.0, index=df.index)
     
     # Calories
     if cal_col in df.columns:
-        df['Cal'] = pd.to_numeric(df[cal_col], errors='coerce').fillna(0)
+        cal = pd.to_numeric(df[cal_col], errors='coerce').fillna(0)
     else:
-        df['Cal'] = 0
-    
-    # Classify by type
-    if type_col in df.columns:
-        df[type_col] = pd.to_numeric(df[type_col], errors='coerce')
-    
-    is_meditation = df[type_col].isin(MEDITATION_TYPES) if type_col in df.columns else pd.Series(False, index=df.index)
-    is_auto = df[type_col].isin(AUTO_DETECTED) if type_col in df.columns else pd.Series(False, index=df.index)
-    is_real_exercise = ~is_meditation & ~is_auto
-    
-    auto_count = is_auto.sum()
-    print(f"    Excluded {auto_count} auto-detected entries (type 0)")
+        cal = pd.Series(0.0, index=df.index)
     
     # Meditation daily summary
-    med_df = df[is_meditation]
-    if not med_df.empty:
-        daily_med = med_df.groupby('Date').agg(Meditation_Minutes=('Duration_min', 'sum')).reset_index()
-    else:
-        daily_med = pd.DataFrame(columns=['Date', 'Meditation_Minutes'])
+    med = is_meditation & has_date
+    daily_med = _daily_sums(dates[med], {'Meditation_Minutes': minutes[med]})
     
     # Real exercise daily summary
-    ex_df = df[is_real_exercise]
-    if not ex_df.empty:
-        daily_ex = ex_df.groupby('Date').agg(
-            Exercise_Calories=('Cal', 'sum'),
-            Exercise_Minutes=('Duration_min', 'sum'),
-        ).reset_index()
-    else:
-        daily_ex = pd.DataFrame(columns=['Date', 'Exercise_Calories', 'Exercise_Minutes'])
+    ex = ~is_meditation & has_date
+    daily_ex = _daily_sums(dates[ex], {
+        'Exercise_Calories': cal[ex],
+        'Exercise_Minutes': minutes[ex],
+    })
+    # Kept on the frame (and so in the parse cache) for main() to report
+    daily_ex.attrs['auto_excluded'] = int(is_auto.sum())
     
     return daily_ex, daily_med
 
@@ -210,36 +334,52 @@ def parse_strength_workouts(csv_path):
         print("  Strength file not found.")
         return pd.DataFrame(columns=['Date', 'Strength_Sets', 'Strength_Volume_lbs', 'Strength_Exercises'])
     
-    df = pd.read_csv(csv_path)
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce').dt.normalize()
+    df = pd.read_csv(csv_path, usecols=['Date', 'Exercise', 'Set #', 'Reps', 'Weight'],
+                     dtype={'Exercise': 'category'})
+    dates, unreadable = _parse_dates(df['Date'])
+    df['Date'] = dates.dt.normalize()
     df = df.dropna(subset=['Date'])
     
-    df['Reps'] = pd.to_numeric(df['Reps'], errors='coerce').fillna(0)
-    df['Weight'] = pd.to_numeric(df['Weight'], errors='coerce').fillna(0)
-    df['Volume'] = df['Reps'] * df['Weight']
+    reps, weight = df[['Reps', 'Weight']].apply(pd.to_numeric, errors='coerce').fillna(0).to_numpy().T
     
     daily = df.groupby('Date').agg(
         Strength_Sets=('Set #', 'count'),
-        Strength_Volume_lbs=('Volume', 'sum'),
         Strength_Exercises=('Exercise', 'nunique'),
-    ).reset_index()
-    
-    return daily.sort_values('Date')
+    )
+    # Volume (reps × weight) is summed straight from the arrays, never stored on df
+    daily['Strength_Volume_lbs'] = pd.Series(reps * weight, index=df.index).groupby(df['Date']).sum()
+    daily = daily[['Strength_Sets', 'Strength_Volume_lbs', 'Strength_Exercises']].reset_index()
+    
+    daily = daily.sort_values('Date')
+    daily.attrs['unreadable_dates'] = unreadable
+    return daily
 
 
 # ─── Main ────────────────────────────────────────────────────────────
 
 def main():
+    parser = argparse.ArgumentParser(description="Merge MFP diary and Samsung Health exports into daily CSVs.")
+    parser.add_argument('--force', action='store_true',
+                        help="ignore cached parse results and re-parse every source file")
+    args = parser.parse_args()
+    
     mfp_csv = "/mnt/wdc/MFP/mfp_diary.csv"
+    strength_csv = "/mnt/wdc/MFP/strength_workouts.csv"
     data_dir = "/mnt/wdc/MFP/health_data/"
     mfp_output = os.path.join(data_dir, "mfp_daily_calories.csv")
     merged_output = os.path.join(data_dir, "merged_health_data.csv")
+    cache_dir = os.path.join(data_dir, ".cache")
+    
+    def cached(name, source, parse, *parse_args):
+        return _cached(cache_dir, name, source, parse, *parse_args, force=args.force)
     
     # ── Parse MFP ────────────────────────────────────
     print("=" * 60)
     print("Parsing MFP Diary")
     print("=" * 60)
-    mfp = parse_mfp_diary(mfp_csv)
+    mfp = cached('mfp', mfp_csv, parse_mfp_diary, mfp_csv)
+    if mfp.attrs.get('unreadable_dates'):
+        print(f"    Dropped {mfp.attrs['unreadable_dates']} rows with unreadable dates")
     
     if not mfp.empty:
         print(f"  Days: {len(mfp)} | Range: {mfp['Date'].min().date()} → {mfp['Date'].max().date()}")
@@ -252,7 +392,16 @@ def main():
     print("Parsing Samsung Health")
     print("=" * 60)
     
-    weight = parse_samsung_weight(data_dir)
+    # The remaining sources are independent files and read_csv releases the
+    # GIL, so parse them concurrently; results are reported in order below
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        weight_job = pool.submit(cached, 'weight', _pick_weight_file(data_dir, _dir_mtime(data_dir)),
+                                 parse_samsung_weight, data_dir)
+        exercise_job = pool.submit(cached, 'exercise', _pick_exercise_file(data_dir, _dir_mtime(data_dir)),
+                                   parse_samsung_exercise, data_dir)
+        strength_job = pool.submit(cached, 'strength', strength_csv, parse_strength_workouts, strength_csv)
+    
+    weight = weight_job.result()
     print(f"  Weight: {len(weight)} measurements", end="")
     if not weight.empty:
         print(f" ({weight['Date'].min().date()} → {weight['Date'].max().date()})")
@@ -260,7 +409,9 @@ def main():
     else:
         print()
     
-    exercise, meditation = parse_samsung_exercise(data_dir)
+    exercise, meditation = exercise_job.result()
+    if 'auto_excluded' in exercise.attrs:
+        print(f"    Excluded {exercise.attrs['auto_excluded']} auto-detected entries (type 0)")
     print(f"  Exercise: {len(exercise)} days")
     print(f"  Meditation: {len(meditation)} days")
     
@@ -268,8 +419,9 @@ def main():
     print("\n" + "=" * 60)
     print("Parsing Strength Workouts")
     print("=" * 60)
-    strength_csv = "/mnt/wdc/MFP/strength_workouts.csv"
-    strength = parse_strength_workouts(strength_csv)
+    strength = strength_job.result()
+    if strength.attrs.get('unreadable_dates'):
+        print(f"    Dropped {strength.attrs['unreadable_dates']} rows with unreadable dates")
     if not strength.empty:
         print(f"  Days: {len(strength)} | Range: {strength['Date'].min().date()} → {strength['Date'].max().date()}")
         print(f"  Avg sets/day: {strength['Strength_Sets'].mean():.0f} | Avg volume: {strength['Strength_Volume_lbs'].mean():,.0f} lbs")
@@ -279,15 +431,18 @@ def main():
     print("Merging")
     print("=" * 60)
     
-    merged = mfp.copy() if not mfp.empty else pd.DataFrame(columns=['Date'])
-    for extra in [weight, exercise, meditation, strength]:
-        if not extra.empty:
-            merged = pd.merge(merged, extra, on='Date', how='outer')
-    
-    # Filter to relevant range
-    merged = merged[(merged['Date'] >= '2024-12-01') & (merged['Date'] <= '2026-02-21')]
-    merged = merged.sort_values('Date')
-    merged = merged.fillna(0)
+    # Every source has one row per day, so reindex each onto the same fixed
+    # calendar (the relevant range); combining them is then a plain column
+    # concat with no join, and no filtering afterwards
+    days = pd.date_range('2024-12-01', '2026-02-21', freq='D', name='Date')
+    frames = [f.set_index('Date').reindex(days)
+              for f in [mfp, weight, exercise, meditation, strength] if not f.empty]
+    if frames:
+        merged = pd.concat(frames, axis=1)
+        # Keep only days that at least one source reported
+        merged = merged.dropna(how='all').fillna(0).reset_index()
+    else:
+        merged = pd.DataFrame(columns=['Date'])
     
     # Summary
     print(f"  Total days: {len(merged)}")